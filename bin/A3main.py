@@ -1,15 +1,22 @@
 #!/usr/bin/env python3
 
 import os
-import sys
-import ctypes
+import re
+import sqlite3
 import mysql.connector
+import mysql.connector.pooling
 import logging
 from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from asciimatics.screen import Screen
 from asciimatics.scene import Scene
 from asciimatics.widgets import Frame, Layout, Button, TextBox, Label, ListBox, Text, Widget
 from asciimatics.exceptions import NextScene, StopApplication, ResizeScreenError
+from vcparser_bindings import (
+    VCardErrorCode, create_card, validate_card, write_card, delete_card,
+    set_fn, get_fn_value, get_optional_property_count, scan_valid_cards
+)
 
 # Set up logging
 log_dir = os.path.join(os.path.dirname(__file__), 'logs')
@@ -23,110 +30,79 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-# Error codes from VCParser.h
-class VCardErrorCode:
-    OK = 0
-    INV_FILE = 1
-    INV_CARD = 2
-    INV_PROP = 3
-    INV_DT = 4
-    WRITE_ERROR = 5
-    OTHER_ERROR = 6
+# Readable descriptions of the error codes for the log
+_ERROR_MSG = {
+    VCardErrorCode.INV_FILE: "Invalid file",
+    VCardErrorCode.INV_CARD: "Invalid card format",
+    VCardErrorCode.INV_PROP: "Invalid property",
+    VCardErrorCode.INV_DT: "Invalid date/time",
+    VCardErrorCode.WRITE_ERROR: "Write error",
+    VCardErrorCode.OTHER_ERROR: "Other error"
+}
 
-# Python classes mirroring C structures
-class DateTime(ctypes.Structure):
-    _fields_ = [
-        ("UTC", ctypes.c_bool),
-        ("isText", ctypes.c_bool),
-        ("date", ctypes.c_char_p),
-        ("time", ctypes.c_char_p),
-        ("text", ctypes.c_char_p)
-    ]
+# Widget labels and layout column ratios shared by the views, built once
+# instead of on every Frame construction
+_LBL_USER = "Username:"
+_LBL_PASSWORD = "Password:"
+_LBL_DATABASE = "Database:"
+_LBL_FILENAME = "File Name:"
+_LBL_CONTACT = "Contact Name:"
+_LBL_BIRTHDAY = "Birthday:"
+_LBL_ANNIVERSARY = "Anniversary:"
+_LBL_OTHER_PROPS = "Other Properties:"
+_NOT_SPECIFIED = "Not specified"
 
-class Parameter(ctypes.Structure):
-    _fields_ = [
-        ("name", ctypes.c_char_p),
-        ("value", ctypes.c_char_p)
-    ]
+# Matches a non-blank form value, capturing it without surrounding whitespace
+_NAME_RE = re.compile(r"\s*(\S.*?)\s*\Z", re.DOTALL)
 
-class List(ctypes.Structure):
-    _fields_ = [
-        ("head", ctypes.c_void_p),
-        ("tail", ctypes.c_void_p),
-        ("length", ctypes.c_int),
-        ("deleteData", ctypes.CFUNCTYPE(None, ctypes.c_void_p)),
-        ("compare", ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)),
-        ("printData", ctypes.CFUNCTYPE(ctypes.c_char_p, ctypes.c_void_p))
-    ]
+_COLS_FORM = (1, 18, 1)
+_COLS_BTN = (1, 1, 1)
+_COLS_ONE = (1,)
 
-class Property(ctypes.Structure):
-    _fields_ = [
-        ("name", ctypes.c_char_p),
-        ("group", ctypes.c_char_p),
-        ("parameters", ctypes.POINTER(List)),
-        ("values", ctypes.POINTER(List))
-    ]
-
-class Card(ctypes.Structure):
-    _fields_ = [
-        ("fn", ctypes.POINTER(Property)),
-        ("optionalProperties", ctypes.POINTER(List)),
-        ("birthday", ctypes.POINTER(DateTime)),
-        ("anniversary", ctypes.POINTER(DateTime))
-    ]
-
-# Load the C library
-try:
-    lib_path = os.path.join(os.path.dirname(__file__), 'libvcparser.so')
-    libvc = ctypes.CDLL(lib_path)
-    
-    # Set up C function signatures
-    libvc.createCard.argtypes = [ctypes.c_char_p, ctypes.POINTER(ctypes.POINTER(Card))]
-    libvc.createCard.restype = ctypes.c_int  # VCardErrorCode
-    
-    libvc.validateCard.argtypes = [ctypes.POINTER(Card)]
-    libvc.validateCard.restype = ctypes.c_int  # VCardErrorCode
-    
-    libvc.writeCard.argtypes = [ctypes.c_char_p, ctypes.POINTER(Card)]
-    libvc.writeCard.restype = ctypes.c_int  # VCardErrorCode
-    
-    libvc.deleteCard.argtypes = [ctypes.POINTER(Card)]
-    libvc.deleteCard.restype = None
-    
-    libvc.cardToString.argtypes = [ctypes.POINTER(Card)]
-    libvc.cardToString.restype = ctypes.c_char_p
+# Queries run by DBQueryView, prepared on each pooled connection on first use.
+# The server pads each row into its display line (RPAD truncates, so the
+# variable-length columns pad to at least their own length), and the table
+# totals ride along on every row so the view needs one round-trip
+_SQL_ALL_CONTACTS = """
+    SELECT CONCAT(
+               RPAD(c.name, GREATEST(CHAR_LENGTH(c.name), 25), ' '), ' ',
+               RPAD(f.file_name, GREATEST(CHAR_LENGTH(f.file_name), 20), ' '), ' ',
+               RPAD(COALESCE(DATE_FORMAT(c.birthday, '%Y-%m-%d'), 'Not specified'), 15, ' '), ' ',
+               RPAD(COALESCE(DATE_FORMAT(c.anniversary, '%Y-%m-%d'), 'Not specified'), 15, ' ')
+           ) as line,
+           (SELECT COUNT(*) FROM FILE) as file_count,
+           (SELECT COUNT(*) FROM CONTACT) as contact_count
+    FROM CONTACT c
+    JOIN FILE f ON c.file_id = f.file_id
+    ORDER BY c.name, f.file_name
+"""
+# Filters on the indexed bmonth column rather than MONTH(birthday), which
+# would have to be computed for every row
+_SQL_JUNE_CONTACTS = """
+    SELECT c.name, f.file_name, 
+           DATE_FORMAT(c.birthday, '%Y-%m-%d') as birthday
+    FROM CONTACT c
+    JOIN FILE f ON c.file_id = f.file_id
+    WHERE c.bmonth = 6
+    ORDER BY DAY(c.birthday), c.name
+"""
 
-except OSError as e:
-    print(f"Error loading C library: {e}")
-    sys.exit(1)
+# Rows pulled from the server per fetch while formatting query output
+_FETCH_BATCH = 500
 
-# Wrapper functions for C library
-def create_card(filename):
-    """Create a Card object from a file."""
-    card_ptr = ctypes.POINTER(Card)()
-    result = libvc.createCard(filename.encode('utf-8'), ctypes.byref(card_ptr))
-    if result != VCardErrorCode.OK:
-        return None, result
-    return card_ptr, result
+# Connections in the session pool
+_DB_POOL_SIZE = 4
 
-def validate_card(card):
-    """Validate a Card object."""
-    return libvc.validateCard(card)
+# Most prepared statements kept open on each pooled connection: every statement
+# the app runs (the two views, the edit UPDATE and the two create INSERTs)
+_PREPARED_PER_CONNECTION = 5
 
-def write_card(filename, card):
-    """Write a Card object to a file."""
-    return libvc.writeCard(filename.encode('utf-8'), card)
+# Threads parsing changed cards in the background
+_PARSE_WORKERS = min(8, os.cpu_count() or 1)
 
-def delete_card(card):
-    """Delete a Card object."""
-    libvc.deleteCard(card)
-
-def card_to_string(card):
-    """Convert a Card object to string representation."""
-    result = libvc.cardToString(card)
-    if result:
-        return result.decode('utf-8')
-    return None
+# Main view polls between unconditional rescans of the cards directory, so a
+# card edited in place by another program shows up within about 6s
+_FULL_RESCAN_POLLS = 2
 
 class LoginView(Frame):
     def __init__(self, screen, model):
@@ -142,7 +118,7 @@ class LoginView(Frame):
         self.model = model
         
         # Create the form layout
-        layout = Layout([1, 18, 1])
+        layout = Layout(_COLS_FORM)
         self.add_layout(layout)
         
         # Add widgets
@@ -150,45 +126,39 @@ class LoginView(Frame):
         layout.add_widget(Label(""), 1)  # Spacer
         
         self._username = Text(
-            label="Username:",
-            name="username",
-            on_change=self._on_change
+            label=_LBL_USER,
+            name="username"
         )
         layout.add_widget(self._username, 1)
         
         self._password = Text(
-            label="Password:",
+            label=_LBL_PASSWORD,
             name="password",
-            hide_char="*",
-            on_change=self._on_change
+            hide_char="*"
         )
         layout.add_widget(self._password, 1)
         
         self._database = Text(
-            label="Database:",
-            name="database",
-            on_change=self._on_change
+            label=_LBL_DATABASE,
+            name="database"
         )
         layout.add_widget(self._database, 1)
         
         layout.add_widget(Label(""), 1)  # Spacer
         
-        layout2 = Layout([1, 1, 1])
+        layout2 = Layout(_COLS_BTN)
         self.add_layout(layout2)
         layout2.add_widget(Button("OK", self._ok), 1)
         layout2.add_widget(Button("Cancel", self._cancel), 1)
         
         # Add status message area
-        layout3 = Layout([1])
+        layout3 = Layout(_COLS_ONE)
         self.add_layout(layout3)
         self._status = Label("", align="^")
         layout3.add_widget(self._status)
         
         self.fix()
     
-    def _on_change(self):
-        self.save()
-    
     def _ok(self):
         self.save()
         username = self.data["username"]
@@ -196,13 +166,22 @@ class LoginView(Frame):
         database = self.data["database"]
         
         try:
-            # Try to connect to the database
-            conn = mysql.connector.connect(
-                host="dursley.socs.uoguelph.ca",
-                user=username,
-                password=password,
-                database=database
+            config = {
+                "host": "dursley.socs.uoguelph.ca",
+                "user": username,
+                "password": password,
+                "database": database
+            }
+            
+            # Open a small pool of connections for the rest of the session.
+            # Sessions are not reset on release so prepared statements survive,
+            # which means an open transaction would survive too: autocommit ends
+            # every read right away so no connection keeps an old snapshot.
+            pool = mysql.connector.pooling.MySQLConnectionPool(
+                pool_name="vcard", pool_size=_DB_POOL_SIZE, pool_reset_session=False,
+                autocommit=True, **config
             )
+            conn = pool.get_connection()
             
             # Create tables if they don't exist
             cursor = conn.cursor()
@@ -225,21 +204,36 @@ class LoginView(Frame):
                     birthday DATETIME,
                     anniversary DATETIME,
                     file_id INT NOT NULL,
-                    FOREIGN KEY (file_id) REFERENCES FILE(file_id) ON DELETE CASCADE
+                    bmonth TINYINT AS (MONTH(birthday)) STORED,
+                    FOREIGN KEY (file_id) REFERENCES FILE(file_id) ON DELETE CASCADE,
+                    INDEX idx_contact_bmonth (bmonth, birthday)
                 )
             """)
             
+            # Tables created before the birth month column existed need it added
+            cursor.execute("""
+                SELECT COUNT(*) FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE()
+                  AND TABLE_NAME = 'CONTACT'
+                  AND COLUMN_NAME = 'bmonth'
+            """)
+            if not cursor.fetchone()[0]:
+                cursor.execute("""
+                    ALTER TABLE CONTACT
+                        ADD COLUMN bmonth TINYINT AS (MONTH(birthday)) STORED,
+                        ADD INDEX idx_contact_bmonth (bmonth, birthday)
+                """)
+            
             conn.commit()
             cursor.close()
             conn.close()
             
-            # Store connection info in model
-            self.model.db_config = {
-                "host": "dursley.socs.uoguelph.ca",
-                "user": username,
-                "password": password,
-                "database": database
-            }
+            # Store the pool and connection info in model. The previous session is
+            # only replaced once the new one is fully set up, so a failed re-login
+            # leaves db_pool and db_config as they were.
+            self.model.close_db()
+            self.model.db_pool = pool
+            self.model.db_config = config
             
             # Proceed to main view
             raise NextScene("Main")
@@ -287,7 +281,7 @@ class MainView(Frame):
         layout2.add_widget(Button("Exit", self._quit), 3)
         
         # Add status message area
-        layout3 = Layout([1])
+        layout3 = Layout(_COLS_ONE)
         self.add_layout(layout3)
         self._status = Label("", align="^")
         layout3.add_widget(self._status)
@@ -296,6 +290,7 @@ class MainView(Frame):
         self.fix()
         
         # Populate the list
+        self._last_cards = None
         self._refresh_list()
     
     def _refresh_list(self):
@@ -307,21 +302,36 @@ class MainView(Frame):
             # Get valid cards
             valid_cards = self.model.get_valid_cards()
             
+            # Every widget assignment queues a redraw, so skip it when nothing changed
+            cards = tuple(valid_cards)
+            if cards == self._last_cards:
+                return
+            self._last_cards = cards
+            
             # Update the list view
             self._list_view.options = [(filename, filename) for filename in valid_cards]
             
             # Update status
             if not valid_cards:
-                self._status.text = "No valid vCard files found"
+                status = "No valid vCard files found"
                 logging.info("No valid vCard files found in directory")
             else:
-                self._status.text = f"Found {len(valid_cards)} valid vCard files"
-                logging.info(f"Found {len(valid_cards)} valid vCard files")
+                status = f"Found {len(valid_cards)} valid vCard files"
+                logging.info("Found %d valid vCard files", len(valid_cards))
+            if self._status.text != status:
+                self._status.text = status
                 
         except Exception as e:
+            self._last_cards = None
             self._status.text = f"Error reading cards: {str(e)}"
             logging.exception("Error while refreshing card list")
     
+    def reset(self):
+        # Called when the scene becomes active, e.g. after creating or editing a card
+        super().reset()
+        if self.model.cards_changed():
+            self._refresh_list()
+    
     def _on_pick(self):
         """Called when a file is selected in the list."""
         self.save()
@@ -347,13 +357,18 @@ class MainView(Frame):
     
     @property
     def frame_update_count(self):
-        # Refresh the list every 10 frames
-        return 10
+        # Saves and scene changes trigger refreshes directly; this poll (about
+        # every 3s at 20 fps) is only a safety net for changes made outside the app
+        return 60
     
     def _update(self, frame_no):
-        # Refresh the list periodically
+        # Rescan when a card was saved or the directory itself changed. Editing a
+        # card in place leaves the directory mtime alone, so every few polls
+        # rescan anyway; an unchanged directory only costs one stat per card.
         super()._update(frame_no)
-        if frame_no % self.frame_update_count == 0:
+        if frame_no % self.frame_update_count != 0:
+            return
+        if frame_no % (self.frame_update_count * _FULL_RESCAN_POLLS) == 0 or self.model.cards_changed():
             self._refresh_list()
 
 class CreateCardView(Frame):
@@ -370,21 +385,19 @@ class CreateCardView(Frame):
         self.model = model
         
         # Create the form layout
-        layout = Layout([1, 18, 1])
+        layout = Layout(_COLS_FORM)
         self.add_layout(layout)
         
         # Add widgets - only filename and contact name are editable
         self._filename = Text(
-            label="File Name:",
-            name="filename",
-            on_change=self._on_change
+            label=_LBL_FILENAME,
+            name="filename"
         )
         layout.add_widget(self._filename, 1)
         
         self._contact_name = Text(
-            label="Contact Name:",
-            name="contact_name",
-            on_change=self._on_change
+            label=_LBL_CONTACT,
+            name="contact_name"
         )
         layout.add_widget(self._contact_name, 1)
         
@@ -396,13 +409,13 @@ class CreateCardView(Frame):
         layout.add_widget(Label(""), 1)  # Spacer
         
         # Add buttons
-        layout2 = Layout([1, 1, 1])
+        layout2 = Layout(_COLS_BTN)
         self.add_layout(layout2)
         layout2.add_widget(Button("OK", self._ok), 1)
         layout2.add_widget(Button("Cancel", self._cancel), 1)
         
         # Add status message area
-        layout3 = Layout([1])
+        layout3 = Layout(_COLS_ONE)
         self.add_layout(layout3)
         self._status = Label("", align="^")
         layout3.add_widget(self._status)
@@ -415,22 +428,20 @@ class CreateCardView(Frame):
         
         self.fix()
     
-    def _on_change(self):
-        self.save()
-        logging.debug("Form field changed")
-    
     def _ok(self):
         self.save()
         logging.debug("CreateCardView._ok called")
         
         try:
             # Validate inputs
-            if not self.data["contact_name"].strip():
+            name_match = _NAME_RE.match(self.data["contact_name"])
+            if not name_match:
                 self._status.text = "Contact name cannot be empty"
                 logging.warning("Empty contact name provided")
                 return
+            contact_name = name_match.group(1)
             
-            if not self.data["filename"].strip():
+            if not _NAME_RE.match(self.data["filename"]):
                 self._status.text = "File name cannot be empty"
                 logging.warning("Empty filename provided")
                 return
@@ -438,72 +449,58 @@ class CreateCardView(Frame):
             # Add .vcf extension if missing
             if not self.data["filename"].endswith('.vcf'):
                 self.data["filename"] += '.vcf'
-                logging.debug(f"Added .vcf extension to filename: {self.data['filename']}")
+                logging.debug("Added .vcf extension to filename: %s", self.data['filename'])
             
-            filepath = os.path.abspath(os.path.join(self.model.cards_dir, self.data["filename"]))
-            logging.debug(f"Full filepath for new card: {filepath}")
+            filepath = os.path.join(self.model.cards_dir, self.data["filename"])
+            logging.debug("Full filepath for new card: %s", filepath)
             
             if os.path.exists(filepath):
                 self._status.text = "File already exists"
-                logging.warning(f"File already exists: {filepath}")
+                logging.warning("File already exists: %s", filepath)
                 return
             
             try:
                 # Create minimal vCard content
                 vcard_content = "BEGIN:VCARD\r\nVERSION:4.0\r\nFN:{}\r\nEND:VCARD\r\n".format(
-                    self.data["contact_name"].strip()
+                    contact_name
                 )
-                logging.debug(f"Generated vCard content:\n{vcard_content}")
+                logging.debug("Generated vCard content:\n%s", vcard_content)
                 
                 # Write the initial vCard file
                 with open(filepath, 'w', newline='') as f:
                     f.write(vcard_content)
-                logging.info(f"Written vCard file: {filepath}")
+                logging.info("Written vCard file: %s", filepath)
                 
                 # Create and validate the card
                 card, result = create_card(filepath)
-                logging.debug(f"create_card result: {result}")
+                logging.debug("create_card result: %s", result)
                 
                 if result != VCardErrorCode.OK:
                     os.remove(filepath)
                     self._status.text = f"Error creating card: Invalid format (code {result})"
-                    logging.error(f"Card creation failed with code {result}")
+                    logging.error("Card creation failed with code %s", result)
                     return
                 
+                # List the new card straight away instead of after a background parse
+                self.model.add_saved_card(self.data["filename"], card)
+                
                 # Update database if connected
                 if self.model.db_config:
                     try:
-                        conn = mysql.connector.connect(**self.model.db_config)
-                        cursor = conn.cursor()
-                        
-                        # Insert into FILE table
-                        cursor.execute("""
-                            INSERT INTO FILE (file_name, creation_time, last_modified)
-                            VALUES (%s, NOW(), NOW())
-                        """, (self.data["filename"],))
-                        
-                        # Get the file_id
-                        file_id = cursor.lastrowid
-                        
-                        # Insert into CONTACT table
-                        cursor.execute("""
-                            INSERT INTO CONTACT (name, file_id)
-                            VALUES (%s, %s)
-                        """, (self.data["contact_name"], file_id))
-                        
-                        conn.commit()
-                        cursor.close()
-                        conn.close()
+                        self.model.add_card_record(self.data["filename"], contact_name)
                         logging.info("Database updated successfully")
                     except mysql.connector.Error as err:
                         self._status.text = f"Database Error: {err}"
-                        logging.error(f"Database error: {err}")
+                        logging.error("Database error: %s", err)
                         return
                 
                 delete_card(card)
                 logging.info("Card created successfully")
+                self.model.cards_dirty = True
                 raise NextScene("Main")
                 
+            except NextScene:
+                raise
             except Exception as e:
                 self._status.text = f"Error creating card: {str(e)}"
                 logging.exception("Unexpected error during card creation")
@@ -533,40 +530,39 @@ class EditCardView(Frame):
         self.model = model
         
         # Create the form layout
-        layout = Layout([1, 18, 1])
+        layout = Layout(_COLS_FORM)
         self.add_layout(layout)
         
         # Add widgets
         self._filename = Text(
-            label="File Name:",
+            label=_LBL_FILENAME,
             name="filename",
             readonly=True  # Always readonly in edit mode
         )
         layout.add_widget(self._filename, 1)
         
         self._contact_name = Text(
-            label="Contact Name:",
-            name="contact_name",
-            on_change=self._on_change
+            label=_LBL_CONTACT,
+            name="contact_name"
         )
         layout.add_widget(self._contact_name, 1)
         
         self._birthday = Text(
-            label="Birthday:",
+            label=_LBL_BIRTHDAY,
             name="birthday",
             readonly=True
         )
         layout.add_widget(self._birthday, 1)
         
         self._anniversary = Text(
-            label="Anniversary:",
+            label=_LBL_ANNIVERSARY,
             name="anniversary",
             readonly=True
         )
         layout.add_widget(self._anniversary, 1)
         
         self._other_props = Text(
-            label="Other Properties:",
+            label=_LBL_OTHER_PROPS,
             name="other_props",
             readonly=True
         )
@@ -575,13 +571,13 @@ class EditCardView(Frame):
         layout.add_widget(Label(""), 1)  # Spacer
         
         # Add buttons
-        layout2 = Layout([1, 1, 1])
+        layout2 = Layout(_COLS_BTN)
         self.add_layout(layout2)
         layout2.add_widget(Button("OK", self._ok), 1)
         layout2.add_widget(Button("Cancel", self._cancel), 1)
         
         # Add status message area
-        layout3 = Layout([1])
+        layout3 = Layout(_COLS_ONE)
         self.add_layout(layout3)
         self._status = Label("", align="^")
         layout3.add_widget(self._status)
@@ -602,7 +598,7 @@ class EditCardView(Frame):
         super().reset()
         
         # Check if we have a file to edit
-        if not hasattr(self.model, 'current_file'):
+        if not self.model.current_file:
             raise NextScene("Main")
         
         # Load the card data
@@ -610,107 +606,63 @@ class EditCardView(Frame):
     
     def _extract_fn_value(self, card):
         """Extract the FN (formatted name) value from a card."""
-        try:
-            if not card or not card.contents:
-                logging.warning("Card or card contents is None")
-                return ""
-                
-            if not hasattr(card.contents, 'fn') or not card.contents.fn:
-                logging.warning("Card has no FN property")
-                return ""
-                
-            fn_prop = card.contents.fn
-            if not fn_prop:
-                logging.warning("FN property is None")
-                return ""
-                
-            if not fn_prop.contents or not fn_prop.contents.values:
-                logging.warning("FN property has no values")
-                return ""
-                
-            values_list = fn_prop.contents.values.contents
-            if not values_list or not values_list.head:
-                logging.warning("Values list is empty")
-                return ""
-                
-            # Get the first value node
-            head_node = values_list.head
-            if not head_node:
-                logging.warning("Head node is None")
-                return ""
-                
-            # Cast the data pointer to char*
-            try:
-                value = ctypes.cast(head_node.contents.data, ctypes.c_char_p)
-                if value and value.value:
-                    return value.value.decode('utf-8')
-            except (AttributeError, ValueError) as e:
-                logging.error(f"Error casting FN value: {e}")
-                return ""
-                
-            return ""
-        except Exception as e:
-            logging.exception("Error extracting FN value")
+        value = get_fn_value(card) if card else None
+        if value is None:
+            logging.warning("Card has no FN value")
             return ""
+        return value
     
     def _format_datetime(self, dt):
         """Format a DateTime structure into a readable string."""
         if not dt:
-            return "Not specified"
-            
-        if dt.contents.isText:
-            return dt.contents.text.decode('utf-8') if dt.contents.text else "Not specified"
-            
-        date_str = dt.contents.date.decode('utf-8') if dt.contents.date else ""
-        time_str = dt.contents.time.decode('utf-8') if dt.contents.time else ""
+            return _NOT_SPECIFIED
         
-        if not date_str and not time_str:
-            return "Not specified"
-            
-        result = date_str
-        if time_str:
-            result += f" {time_str}"
-        if dt.contents.UTC:
-            result += " UTC"
-        return result
+        dt = dt.contents
+        if dt.isText:
+            return dt.text.decode('utf-8') if dt.text else _NOT_SPECIFIED
+        
+        # Assemble the raw bytes and decode once at the end
+        parts = [part for part in (dt.date, dt.time) if part]
+        if not parts:
+            return _NOT_SPECIFIED
+        if dt.UTC:
+            parts.append(b"UTC")
+        return b" ".join(parts).decode('utf-8')
     
     def _count_optional_properties(self, card):
         """Count the number of optional properties in the card."""
-        if not card or not card.contents.optionalProperties:
-            return 0
-            
-        return card.contents.optionalProperties.contents.length
+        return get_optional_property_count(card) if card else 0
     
     def _load_card(self):
         """Load the card data into the form."""
-        if not hasattr(self.model, 'current_file'):
+        if not self.model.current_file:
             raise NextScene("Main")
         
         logging.debug("Loading card data for editing")
-        filepath = os.path.join(self.model.cards_dir, self.model.current_file)
+        filepath = self.model.current_filepath
         card, result = create_card(filepath)
         
         if result == VCardErrorCode.OK:
             try:
                 # Get the formatted name (FN property)
                 fn_value = self._extract_fn_value(card)
-                logging.debug(f"Extracted FN value: {fn_value}")
+                logging.debug("Extracted FN value: %s", fn_value)
                 
                 # Format birthday if present
-                birthday_str = "Not specified"
+                birthday_str = _NOT_SPECIFIED
                 if card.contents.birthday:
                     birthday_str = self._format_datetime(card.contents.birthday)
-                logging.debug(f"Formatted birthday: {birthday_str}")
+                logging.debug("Formatted birthday: %s", birthday_str)
                 
                 # Format anniversary if present
-                anniversary_str = "Not specified"
+                anniversary_str = _NOT_SPECIFIED
                 if card.contents.anniversary:
                     anniversary_str = self._format_datetime(card.contents.anniversary)
-                logging.debug(f"Formatted anniversary: {anniversary_str}")
+                logging.debug("Formatted anniversary: %s", anniversary_str)
                 
                 # Count optional properties
                 opt_props_count = self._count_optional_properties(card)
-                logging.debug(f"Optional properties count: {opt_props_count}")
+                logging.debug("Optional properties count: %s", opt_props_count)
                 
                 # Set form data
                 self.data = {
@@ -729,85 +681,95 @@ class EditCardView(Frame):
             finally:
                 delete_card(card)
         else:
-            logging.error(f"Failed to load card: {result}")
+            logging.error("Failed to load card: %s", result)
             self._status.text = "Error loading card"
             raise NextScene("Main")
     
-    def _on_change(self):
-        self.save()
-        logging.debug("Form field changed")
-    
     def _ok(self):
         self.save()
         logging.debug("EditCardView._ok called")
         
         try:
             # Validate inputs
-            if not self.data["contact_name"].strip():
+            name_match = _NAME_RE.match(self.data["contact_name"])
+            if not name_match:
                 self._status.text = "Contact name cannot be empty"
                 logging.warning("Empty contact name provided")
                 return
+            contact_name = name_match.group(1)
             
-            filepath = os.path.join(self.model.cards_dir, self.model.current_file)
-            logging.debug(f"Attempting to edit card: {filepath}")
+            filepath = self.model.current_filepath
+            logging.debug("Attempting to edit card: %s", filepath)
             
             # Load the existing card
             card, result = create_card(filepath)
             if result != VCardErrorCode.OK:
                 self._status.text = "Error loading card"
-                logging.error(f"Error loading card for editing, code: {result}")
+                logging.error("Error loading card for editing, code: %s", result)
                 return
             
             try:
-                # Create new content with updated FN
-                vcard_content = "BEGIN:VCARD\r\nVERSION:4.0\r\nFN:{}\r\nEND:VCARD\r\n".format(
-                    self.data["contact_name"].strip()
-                )
+                # Update the FN value in place so every other property is kept
+                result = set_fn(card, contact_name)
+                if result != VCardErrorCode.OK:
+                    self._status.text = "Error saving changes"
+                    logging.error("Error updating FN value, code: %s", result)
+                    return
                 
-                # Write the updated card
-                with open(filepath, 'w', newline='') as f:
-                    f.write(vcard_content)
-                logging.info(f"Updated vCard file: {filepath}")
+                # Validate the modified card in memory before it reaches the disk
+                result = validate_card(card)
+                if result != VCardErrorCode.OK:
+                    self._status.text = "Error saving changes: invalid card"
+                    logging.error("Updated card failed validation, code: %s", result)
+                    return
                 
-                # Validate the updated card
-                new_card, new_result = create_card(filepath)
-                if new_result != VCardErrorCode.OK:
+                # Write the updated card
+                result = write_card(filepath, card)
+                if result != VCardErrorCode.OK:
                     self._status.text = "Error saving changes"
-                    logging.error(f"Error validating updated card, code: {new_result}")
+                    logging.error("Error writing updated card, code: %s", result)
                     return
+                logging.info("Updated vCard file: %s", filepath)
+                self.model.add_saved_card(self.model.current_file, card)
                 
                 # Update database if connected
                 if self.model.db_config:
+                    conn = None
                     try:
-                        conn = mysql.connector.connect(**self.model.db_config)
-                        cursor = conn.cursor()
+                        conn = self.model.db_pool.get_connection()
                         
                         # Update CONTACT table
-                        cursor.execute("""
+                        self.model.execute_prepared(conn, """
                             UPDATE CONTACT c
                             JOIN FILE f ON c.file_id = f.file_id
                             SET c.name = %s,
                                 f.last_modified = NOW()
                             WHERE f.file_name = %s
-                        """, (self.data["contact_name"], self.model.current_file))
+                        """, (contact_name, self.model.current_file))
                         
                         conn.commit()
-                        cursor.close()
-                        conn.close()
+                        self.model.invalidate_queries()
                         logging.info("Database updated successfully")
                     except mysql.connector.Error as err:
                         self._status.text = f"Database Error: {err}"
-                        logging.error(f"Database error: {err}")
+                        logging.error("Database error: %s", err)
                         return
+                    finally:
+                        if conn is not None:
+                            conn.close()
                 
-                delete_card(new_card)
                 logging.info("Card updated successfully")
+                self.model.cards_dirty = True
                 raise NextScene("Main")
                 
+            except NextScene:
+                raise
             except Exception as e:
                 self._status.text = f"Error updating card: {str(e)}"
                 logging.exception("Error during card update")
                 return
+            finally:
+                delete_card(card)
             
         except NextScene:
             raise
@@ -819,6 +781,14 @@ class EditCardView(Frame):
     def _cancel(self):
         raise NextScene("Main")
 
+# Fixed-width line builders for the query views (columns 25, 20, 15 and 15 wide).
+# Binding str.ljust as a default makes it a local lookup on every row.
+def _fmt_row3(a, b, c, _l=str.ljust):
+    return f"{_l(a, 25)} {_l(b, 20)} {_l(c, 15)}"
+
+def _fmt_row4(a, b, c, d, _l=str.ljust):
+    return f"{_l(a, 25)} {_l(b, 20)} {_l(c, 15)} {_l(d, 15)}"
+
 class DBQueryView(Frame):
     def __init__(self, screen, model):
         super().__init__(
@@ -847,7 +817,7 @@ class DBQueryView(Frame):
         layout1.add_widget(self._results)
         
         # Add button layout at bottom with proper spacing
-        layout2 = Layout([1, 1, 1])
+        layout2 = Layout(_COLS_BTN)
         self.add_layout(layout2)
         layout2.add_widget(Button("Display all contacts", self._display_all), 0)
         layout2.add_widget(Button("Find contacts born in June", self._find_june), 1)
@@ -866,131 +836,123 @@ class DBQueryView(Frame):
         if not self.model.db_config:
             self._status.text = "No database connection"
             return
-            
+        
+        # Nothing has changed since the last run, so show the same output
+        cached = self.model.get_query_result("all")
+        if cached is not None:
+            self._results.value = cached
+            return
+        
+        conn = None
         try:
-            conn = mysql.connector.connect(**self.model.db_config)
-            cursor = conn.cursor()
+            conn = self.model.db_pool.get_connection()
             
-            # Execute query to get all contacts with file info
-            cursor.execute("""
-                SELECT c.name, f.file_name, 
-                       COALESCE(DATE_FORMAT(c.birthday, '%Y-%m-%d'), 'Not specified') as birthday,
-                       COALESCE(DATE_FORMAT(c.anniversary, '%Y-%m-%d'), 'Not specified') as anniversary
-                FROM CONTACT c
-                JOIN FILE f ON c.file_id = f.file_id
-                ORDER BY c.name, f.file_name
-            """)
+            # Execute query to get all contacts with file info and table totals
+            cursor = self.model.execute_prepared(conn, _SQL_ALL_CONTACTS)
             
-            results = cursor.fetchall()
+            # Format rows a batch at a time instead of buffering the whole result set
+            parts = []
+            while True:
+                batch = cursor.fetchmany(_FETCH_BATCH)
+                if not batch:
+                    break
+                if not parts:
+                    # Create the header
+                    parts.append("All Contacts:\n")
+                    parts.append(_fmt_row4("Name", "File", "Birthday", "Anniversary"))
+                    parts.append("-" * (25 + 20 + 15 * 2 + 3))
+                
+                for line, file_count, contact_count in batch:
+                    parts.append(line)
             
             # Format results
-            if not results:
+            if not parts:
                 self._results.value = "No contacts found in database."
             else:
-                # Define column widths
-                name_width = 25
-                file_width = 20
-                date_width = 15
-                
-                # Create the header
-                output = "All Contacts:\n\n"
-                output += "{:<{nw}} {:<{fw}} {:<{dw}} {:<{dw}}\n".format(
-                    "Name", "File", "Birthday", "Anniversary",
-                    nw=name_width, fw=file_width, dw=date_width
-                )
-                output += "-" * (name_width + file_width + date_width * 2 + 3) + "\n"
-                
-                # Format each row
-                for row in results:
-                    name, filename, birthday, anniversary = row
-                    output += "{:<{nw}} {:<{fw}} {:<{dw}} {:<{dw}}\n".format(
-                        name, filename, birthday, anniversary,
-                        nw=name_width, fw=file_width, dw=date_width
-                    )
-                
                 # Add database statistics
-                cursor.execute("SELECT COUNT(*) FROM FILE")
-                file_count = cursor.fetchone()[0]
-                cursor.execute("SELECT COUNT(*) FROM CONTACT")
-                contact_count = cursor.fetchone()[0]
-                
-                output += f"\nDatabase has {file_count} files and {contact_count} contacts."
+                parts.append(f"\nDatabase has {file_count} files and {contact_count} contacts.")
                 
-                self._results.value = output
+                self._results.value = "\n".join(parts)
             
-            cursor.close()
-            conn.close()
+            self.model.set_query_result("all", self._results.value)
             
         except mysql.connector.Error as err:
             self._status.text = f"Database Error: {err}"
-            logging.error(f"Database error in display_all: {err}")
+            logging.error("Database error in display_all: %s", err)
+        finally:
+            if conn is not None:
+                conn.close()
     
     def _find_june(self):
         """Find contacts born in June."""
         if not self.model.db_config:
             self._status.text = "No database connection"
             return
-            
+        
+        cached = self.model.get_query_result("june")
+        if cached is not None:
+            self._results.value = cached
+            return
+        
+        conn = None
         try:
-            conn = mysql.connector.connect(**self.model.db_config)
-            cursor = conn.cursor()
+            conn = self.model.db_pool.get_connection()
             
             # Execute query to find contacts born in June
-            cursor.execute("""
-                SELECT c.name, f.file_name, 
-                       DATE_FORMAT(c.birthday, '%Y-%m-%d') as birthday
-                FROM CONTACT c
-                JOIN FILE f ON c.file_id = f.file_id
-                WHERE MONTH(c.birthday) = 6
-                ORDER BY DAY(c.birthday), c.name
-            """)
+            cursor = self.model.execute_prepared(conn, _SQL_JUNE_CONTACTS)
             
-            results = cursor.fetchall()
+            # Format rows a batch at a time instead of buffering the whole result set
+            parts = []
+            while True:
+                batch = cursor.fetchmany(_FETCH_BATCH)
+                if not batch:
+                    break
+                if not parts:
+                    # Create the header
+                    parts.append("Contacts Born in June:\n")
+                    parts.append(_fmt_row3("Name", "File", "Birthday"))
+                    parts.append("-" * (25 + 20 + 15 + 2))
+                
+                for name, filename, birthday in batch:
+                    parts.append(_fmt_row3(name, filename, birthday))
             
             # Format results
-            if not results:
+            if not parts:
                 self._results.value = "No contacts with June birthdays found."
             else:
-                # Define column widths
-                name_width = 25
-                file_width = 20
-                date_width = 15
-                
-                # Create the header
-                output = "Contacts Born in June:\n\n"
-                output += "{:<{nw}} {:<{fw}} {:<{dw}}\n".format(
-                    "Name", "File", "Birthday",
-                    nw=name_width, fw=file_width, dw=date_width
-                )
-                output += "-" * (name_width + file_width + date_width + 2) + "\n"
-                
-                # Format each row
-                for row in results:
-                    name, filename, birthday = row
-                    output += "{:<{nw}} {:<{fw}} {:<{dw}}\n".format(
-                        name, filename, birthday,
-                        nw=name_width, fw=file_width, dw=date_width
-                    )
-                
-                self._results.value = output
+                # Keep the trailing newline the view always ended with
+                parts.append("")
+                self._results.value = "\n".join(parts)
             
-            cursor.close()
-            conn.close()
+            self.model.set_query_result("june", self._results.value)
             
         except mysql.connector.Error as err:
             self._status.text = f"Database Error: {err}"
-            logging.error(f"Database error in find_june: {err}")
+            logging.error("Database error in find_june: %s", err)
+        finally:
+            if conn is not None:
+                conn.close()
     
     def _cancel(self):
         raise NextScene("Main")
 
 class Model:
     def __init__(self):
-        # Database configuration
+        # Database configuration and the connection pool shared by all views
         self.db_config = None
+        self.db_pool = None
+        self._prepared = OrderedDict()  # connection id -> OrderedDict(SQL text -> prepared cursor), LRU order
+        
+        # Formatted query output, valid while its generation matches _cache_generation
+        self._query_cache = {}  # query id -> (generation, output)
+        self._cache_generation = 0
         
         # Current working directory
-        self.cards_dir = os.path.join(os.path.dirname(__file__), 'cards')
+        self.cards_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), 'cards'))
+        
+        # Card selected for editing; setting current_file also sets current_filepath
+        self._current_file = None
+        self.current_filepath = None
         
         # Ensure cards directory exists
         if not os.path.exists(self.cards_dir):
@@ -998,138 +960,418 @@ class Model:
             
         # Initialize card cache
         self.card_cache = {}  # filename -> (card_ptr, last_modified)
+        self._sorted_names = []  # card_cache keys in order, rebuilt when the cache changes
+        self._validity_cache = {}  # filename -> ((st_mtime_ns, st_size), is_valid)
+        
+        # Cards checked in earlier runs, so a restart only stats unchanged files
+        self._persisted = {}  # filename -> ((st_mtime_ns, st_size), is_valid)
+        self._mtime_db = self._open_mtime_db()
+        
+        # Changed cards are parsed on a worker pool so the UI never waits on the C library.
+        # ctypes drops the GIL during each call and the parser keeps no global state,
+        # so the workers parse in parallel; only the main thread touches the caches.
+        self._pool = ThreadPoolExecutor(max_workers=_PARSE_WORKERS, thread_name_prefix="vcparse")
+        self._pending = {}  # filename -> ((st_mtime_ns, st_size), last_modified, Future)
+        
+        # Set when a view saves a card; the directory mtime catches outside changes
+        self.cards_dirty = False
+        self._dir_mtime_ns = None
         self.refresh_card_cache()
     
+    @property
+    def current_file(self):
+        """Name of the card selected for editing."""
+        return self._current_file
+    
+    @current_file.setter
+    def current_file(self, filename):
+        # Join the path once here rather than in every view that needs it
+        self._current_file = filename
+        self.current_filepath = os.path.join(self.cards_dir, filename) if filename else None
+    
     def refresh_card_cache(self):
         """Scan directory and update card cache."""
         logging.info("Refreshing card cache")
+        self.cards_dirty = False
         current_files = set()
         
         try:
             # Log the cards directory path
-            logging.info(f"Scanning directory: {self.cards_dir}")
+            logging.info("Scanning directory: %s", self.cards_dir)
+            
+            # Taken before listing so changes made during the scan show up next time
+            self._dir_mtime_ns = os.stat(self.cards_dir).st_mtime_ns
+            
+            # Pick up cards parsed in the background since the last refresh
+            self._collect_parsed()
             
-            # Get all files in directory
-            all_files = os.listdir(self.cards_dir)
-            logging.info(f"All files in directory: {all_files}")
+            # Get all files in directory; each entry already knows its full path
+            with os.scandir(self.cards_dir) as it:
+                entries = list(it)
+            logging.info("All files in directory: %s", [entry.name for entry in entries])
+            
+            # On a cold cache every file needs parsing, so validate the whole
+            # directory in one C call instead of three calls per file
+            prevalidated = None
+            if not self._validity_cache and not self._persisted:
+                # Stat the cards first: the entries keep these results, so a file
+                # changed during the scan is cached under a key older than what
+                # the scan read and gets checked again by the next refresh
+                for entry in entries:
+                    if entry.name.endswith('.vcf'):
+                        entry.stat()
+                
+                result, valid_files = scan_valid_cards(self.cards_dir)
+                if result == VCardErrorCode.OK:
+                    prevalidated = set(valid_files)
+                    logging.info("Batch scan found %d valid cards", len(prevalidated))
+                else:
+                    logging.error("Batch scan of %s failed (code %s)", self.cards_dir, result)
             
             # Scan all .vcf files
-            for filename in all_files:
+            for entry in entries:
+                filename = entry.name
                 if not filename.endswith('.vcf'):
-                    logging.debug(f"Skipping non-vcf file: {filename}")
+                    logging.debug("Skipping non-vcf file: %s", filename)
                     continue
                     
-                filepath = os.path.join(self.cards_dir, filename)
+                filepath = entry.path
                 current_files.add(filename)
-                logging.info(f"Found vCard file: {filename}")
                 
-                # Log file details
-                file_stat = os.stat(filepath)
-                logging.info(f"File details for {filename}:")
-                logging.info(f"  Size: {file_stat.st_size} bytes")
-                logging.info(f"  Permissions: {oct(file_stat.st_mode)}")
-                logging.info(f"  Modified: {datetime.fromtimestamp(file_stat.st_mtime)}")
-                
-                # Check if file was modified since last cache
-                last_modified = os.path.getmtime(filepath)
-                if (filename in self.card_cache and 
-                    self.card_cache[filename][1] == last_modified):
-                    logging.info(f"Card {filename} unchanged, using cached version")
+                # Check if file was modified since it was last validated,
+                # before any logging or reading is spent on it
+                file_stat = entry.stat()
+                stat_key = (file_stat.st_mtime_ns, file_stat.st_size)
+                cached = self._validity_cache.get(filename)
+                if cached is not None and cached[0] == stat_key:
                     continue  # File hasn't changed, skip processing
                 
+                # A parse of this exact version is already running
+                pending = self._pending.get(filename)
+                if pending is not None and pending[0] == stat_key:
+                    continue
+                
+                # Checked in an earlier run and untouched since; get_card parses valid ones on demand
+                persisted = self._persisted.get(filename)
+                if persisted is not None and persisted[0] == stat_key:
+                    self._cache_result(filename, stat_key, file_stat.st_mtime, persisted[1])
+                    continue
+                
+                # Log file details; the timestamp is only built when INFO is on
+                if logging.getLogger().isEnabledFor(logging.INFO):
+                    logging.info("Found vCard file: %s", filename)
+                    logging.info("File details for %s:", filename)
+                    logging.info("  Size: %d bytes", file_stat.st_size)
+                    logging.info("  Permissions: 0o%o", file_stat.st_mode)
+                    logging.info("  Modified: %s", datetime.fromtimestamp(file_stat.st_mtime))
+                
+                last_modified = file_stat.st_mtime
+                
                 # Create and validate card
                 try:
-                    logging.info(f"Processing card: {filename}")
-                    
-                    # Log file contents for debugging
-                    with open(filepath, 'r') as f:
-                        content = f.read()
-                        logging.info(f"File contents of {filename}:\n{content}")
-                    
-                    card_ptr, result = create_card(filepath)
-                    
-                    # Log detailed error for card creation
-                    if result != VCardErrorCode.OK:
-                        error_msg = {
-                            VCardErrorCode.INV_FILE: "Invalid file",
-                            VCardErrorCode.INV_CARD: "Invalid card format",
-                            VCardErrorCode.INV_PROP: "Invalid property",
-                            VCardErrorCode.INV_DT: "Invalid date/time",
-                            VCardErrorCode.WRITE_ERROR: "Write error",
-                            VCardErrorCode.OTHER_ERROR: "Other error"
-                        }.get(result, "Unknown error")
-                        logging.error(f"Failed to create card {filename}: {error_msg} (code {result})")
-                        if filename in self.card_cache:
-                            del self.card_cache[filename]
-                        continue
-                    
-                    logging.info(f"Successfully created card for {filename}")
-                    
-                    # Validate the card
-                    val_result = validate_card(card_ptr)
-                    
-                    # Log detailed error for validation
-                    if val_result != VCardErrorCode.OK:
-                        error_msg = {
-                            VCardErrorCode.INV_FILE: "Invalid file",
-                            VCardErrorCode.INV_CARD: "Invalid card format",
-                            VCardErrorCode.INV_PROP: "Invalid property",
-                            VCardErrorCode.INV_DT: "Invalid date/time",
-                            VCardErrorCode.WRITE_ERROR: "Write error",
-                            VCardErrorCode.OTHER_ERROR: "Other error"
-                        }.get(val_result, "Unknown error")
-                        logging.error(f"Card validation failed for {filename}: {error_msg} (code {val_result})")
-                        delete_card(card_ptr)
-                        if filename in self.card_cache:
-                            del self.card_cache[filename]
-                        continue
-                    
-                    logging.info(f"Successfully validated card for {filename}")
+                    logging.info("Processing card: %s", filename)
                     
-                    # Cache the valid card
-                    if filename in self.card_cache:
-                        # Delete old card pointer
-                        old_card_ptr = self.card_cache[filename][0]
-                        if old_card_ptr:
-                            delete_card(old_card_ptr)
-                            logging.info(f"Deleted old card pointer for {filename}")
-                    
-                    self.card_cache[filename] = (card_ptr, last_modified)
-                    logging.info(f"Successfully cached valid card: {filename}")
+                    if prevalidated is None:
+                        # Parse off the UI thread; a later refresh collects the result
+                        self._submit_parse(filename, filepath, stat_key, last_modified)
+                    elif filename in prevalidated:
+                        # Already validated by the batch scan; get_card parses it on demand
+                        self._cache_result(filename, stat_key, last_modified, True)
+                    else:
+                        logging.error("Card validation failed for %s", filename)
+                        self._cache_result(filename, stat_key, last_modified, False)
                     
                 except Exception as e:
-                    logging.exception(f"Error processing card {filename}: {str(e)}")
-                    if filename in self.card_cache:
-                        del self.card_cache[filename]
+                    logging.exception("Error processing card %s: %s", filename, e)
+                    self._cache_result(filename, stat_key, last_modified, False)
             
-            # Log cache state
-            logging.info(f"Current cache state:")
-            for filename, (card_ptr, mtime) in self.card_cache.items():
-                logging.info(f"  {filename}: last_modified={datetime.fromtimestamp(mtime)}")
+            # Log cache state; the per-card timestamps are only built when INFO is on
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info("Current cache state:")
+                for filename, (card_ptr, mtime) in self.card_cache.items():
+                    logging.info("  %s: last_modified=%s", filename, datetime.fromtimestamp(mtime))
             
             # Remove cached cards that no longer exist
             for filename in list(self.card_cache.keys()):
                 if filename not in current_files:
-                    logging.info(f"Removing deleted card from cache: {filename}")
+                    logging.info("Removing deleted card from cache: %s", filename)
                     card_ptr = self.card_cache[filename][0]
                     if card_ptr:
                         delete_card(card_ptr)
                     del self.card_cache[filename]
+                    self.invalidate_queries()
+            
+            # Forget validation results and parses for files that no longer exist
+            for filename in list(self._validity_cache.keys()):
+                if filename not in current_files:
+                    del self._validity_cache[filename]
+            for filename in list(self._persisted.keys()):
+                if filename not in current_files:
+                    self._forget_persisted(filename)
+            for filename in list(self._pending.keys()):
+                if filename not in current_files:
+                    self._discard_pending(self._pending.pop(filename)[2])
+            
+            if self._mtime_db is not None:
+                self._mtime_db.commit()
             
-            logging.info(f"Card cache refresh complete. Valid cards: {list(self.card_cache.keys())}")
+            logging.info("Card cache refresh complete. Valid cards: %s", list(self.card_cache.keys()))
                     
         except Exception as e:
-            logging.exception(f"Error refreshing card cache: {str(e)}")
+            logging.exception("Error refreshing card cache: %s", e)
+        
+        self._sorted_names = sorted(self.card_cache)
+    
+    def add_saved_card(self, filename, card_ptr):
+        """Cache a card the app itself just wrote, so views see it without waiting on a refresh.
+        
+        card_ptr is the parsed card and stays owned by the caller; get_card
+        parses the file again when it is needed.
+        """
+        file_stat = os.stat(os.path.join(self.cards_dir, filename))
+        stat_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        pending = self._pending.pop(filename, None)
+        if pending is not None:
+            self._discard_pending(pending[2])
+        valid = validate_card(card_ptr) == VCardErrorCode.OK
+        self._cache_result(filename, stat_key, file_stat.st_mtime, valid)
+        self._sorted_names = sorted(self.card_cache)
+    
+    def _submit_parse(self, filename, filepath, stat_key, last_modified):
+        """Queue a card for parsing and validation on the worker pool."""
+        stale = self._pending.get(filename)
+        if stale is not None:
+            # The file changed again before its previous parse finished
+            self._discard_pending(stale[2])
+        future = self._pool.submit(self._load_card_file, filename, filepath)
+        self._pending[filename] = (stat_key, last_modified, future)
+    
+    def _collect_parsed(self):
+        """Move finished background parses into the card cache."""
+        for filename, (stat_key, last_modified, future) in list(self._pending.items()):
+            if not future.done():
+                continue
+            del self._pending[filename]
+            try:
+                card_ptr = future.result()
+            except Exception:
+                logging.exception("Error processing card %s", filename)
+                card_ptr = None
+            self._cache_result(filename, stat_key, last_modified, card_ptr is not None, card_ptr)
+    
+    @staticmethod
+    def _discard_pending(future):
+        """Drop a parse whose result is no longer wanted, freeing its card."""
+        if future.cancel():
+            return
+        
+        def free_card(done):
+            card_ptr = None if done.exception() else done.result()
+            if card_ptr:
+                delete_card(card_ptr)
+        
+        future.add_done_callback(free_card)
+    
+    def _cache_result(self, filename, stat_key, last_modified, valid, card_ptr=None):
+        """Record the validation outcome for a file and update the card cache.
+        
+        Invalid files are remembered too, so they are not re-parsed until they change.
+        """
+        self._validity_cache[filename] = (stat_key, valid)
+        self.invalidate_queries()
+        
+        # Delete old card pointer
+        old_entry = self.card_cache.pop(filename, None)
+        if old_entry and old_entry[0]:
+            delete_card(old_entry[0])
+            logging.info("Deleted old card pointer for %s", filename)
+        
+        if valid:
+            self.card_cache[filename] = (card_ptr, last_modified)
+            logging.info("Successfully cached valid card: %s", filename)
+        
+        if self._persisted.get(filename) != (stat_key, valid):
+            self._persisted[filename] = (stat_key, valid)
+            if self._mtime_db is not None:
+                self._mtime_db.execute(
+                    "INSERT OR REPLACE INTO card_validity (name, mtime_ns, size, valid) VALUES (?, ?, ?, ?)",
+                    (filename, *stat_key, valid))
+    
+    def _forget_persisted(self, filename):
+        """Drop a card from the persistent validity cache."""
+        del self._persisted[filename]
+        if self._mtime_db is not None:
+            self._mtime_db.execute("DELETE FROM card_validity WHERE name = ?", (filename,))
+    
+    def _open_mtime_db(self):
+        """Open the persistent validity cache and load its rows.
+        
+        It lives beside logs/ rather than in the cards directory: its journal file
+        would otherwise move the directory mtime on every commit and make
+        cards_changed() report a change that is not there. The cache only saves
+        work, so if it cannot be opened the app runs without it.
+        """
+        try:
+            db = sqlite3.connect(os.path.join(os.path.dirname(__file__), '.cache.sqlite'))
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS card_validity (
+                    name TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    valid INTEGER NOT NULL
+                )
+            """)
+            for name, mtime_ns, size, valid in db.execute(
+                    "SELECT name, mtime_ns, size, valid FROM card_validity"):
+                self._persisted[name] = ((mtime_ns, size), bool(valid))
+            return db
+        except sqlite3.Error as e:
+            logging.error("Card validity cache unavailable: %s", e)
+            self._persisted.clear()
+            return None
+    
+    def _load_card_file(self, filename, filepath):
+        """Create and validate a single card, returning its pointer or None."""
+        card_ptr, result = create_card(filepath)
+        
+        # Log detailed error for card creation
+        if result != VCardErrorCode.OK:
+            error_msg = _ERROR_MSG.get(result, "Unknown error")
+            logging.error("Failed to create card %s: %s (code %s)", filename, error_msg, result)
+            return None
+        
+        logging.info("Successfully created card for %s", filename)
+        
+        # Validate the card
+        val_result = validate_card(card_ptr)
+        
+        # Log detailed error for validation
+        if val_result != VCardErrorCode.OK:
+            error_msg = _ERROR_MSG.get(val_result, "Unknown error")
+            logging.error("Card validation failed for %s: %s (code %s)", filename, error_msg, val_result)
+            delete_card(card_ptr)
+            return None
+        
+        logging.info("Successfully validated card for %s", filename)
+        return card_ptr
+    
+    def execute_prepared(self, conn, sql, params=()):
+        """Execute sql on a pooled connection as a prepared statement and return its cursor.
+        
+        Each statement keeps its own cursor per server connection, so running it again
+        only sends the parameters instead of re-parsing the SQL. Callers must fetch all rows.
+        
+        At most _PREPARED_PER_CONNECTION statements stay open per connection; the
+        least recently used one is closed on the server to make room.
+        """
+        conn_id = conn.connection_id
+        statements = self._prepared.get(conn_id)
+        if statements is None:
+            statements = self._prepared[conn_id] = OrderedDict()
+            if len(self._prepared) > _DB_POOL_SIZE:
+                # More ids than pooled connections means the pool reconnected one
+                # under a new id. Its old session is gone and the new session reuses
+                # statement ids from 1, so the stale cursors are dropped, not closed.
+                self._prepared.popitem(last=False)
+        else:
+            self._prepared.move_to_end(conn_id)
+        
+        cursor = statements.get(sql)
+        if cursor is None:
+            cursor = conn.cursor(prepared=True)
+            statements[sql] = cursor
+            if len(statements) > _PREPARED_PER_CONNECTION:
+                # Prepared on this same session, so its statement id is still its own
+                _, evicted = statements.popitem(last=False)
+                evicted.close()
+        else:
+            statements.move_to_end(sql)
+        cursor.execute(sql, params)
+        return cursor
+    
+    def get_query_result(self, query_id):
+        """Return the cached output of a query, or None if cards changed since it ran."""
+        entry = self._query_cache.get(query_id)
+        if entry is not None and entry[0] == self._cache_generation:
+            return entry[1]
+        return None
+    
+    def set_query_result(self, query_id, output):
+        """Cache the formatted output of a query for the current generation."""
+        self._query_cache[query_id] = (self._cache_generation, output)
+    
+    def invalidate_queries(self):
+        """Mark every cached query result as stale."""
+        self._cache_generation += 1
+    
+    def add_card_record(self, file_name, contact_name):
+        """Insert the FILE and CONTACT rows for a new card in one transaction."""
+        conn = self.db_pool.get_connection()
+        try:
+            conn.start_transaction()
+            
+            # Insert into FILE table
+            cursor = self.execute_prepared(conn, """
+                INSERT INTO FILE (file_name, creation_time, last_modified)
+                VALUES (%s, NOW(), NOW())
+            """, (file_name,))
+            
+            # Insert into CONTACT table
+            self.execute_prepared(conn, """
+                INSERT INTO CONTACT (name, file_id)
+                VALUES (%s, %s)
+            """, (contact_name, cursor.lastrowid))
+            
+            conn.commit()
+            self.invalidate_queries()
+        except mysql.connector.Error:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+    
+    def close_db(self):
+        """Close the idle connections in the pool if one is open."""
+        self._prepared.clear()
+        self._query_cache.clear()
+        if self.db_pool is not None:
+            # MySQLConnectionPool has no public way to close its connections, so
+            # this relies on its private _remove_connections. Should a later
+            # mysql.connector drop it, the connections close when the pool is freed.
+            remove_connections = getattr(self.db_pool, "_remove_connections", None)
+            if remove_connections is not None:
+                try:
+                    remove_connections()
+                except mysql.connector.Error as err:
+                    logging.error("Error closing database connections: %s", err)
+            self.db_pool = None
+    
+    def cards_changed(self):
+        """Return True if the card cache may be out of date."""
+        if self.cards_dirty:
+            return True
+        if any(future.done() for _, _, future in self._pending.values()):
+            return True
+        try:
+            return os.stat(self.cards_dir).st_mtime_ns != self._dir_mtime_ns
+        except OSError:
+            return True
     
     def get_valid_cards(self):
-        """Return list of valid card filenames."""
-        return sorted(self.card_cache.keys())
+        """Return the sorted list of valid card filenames; callers must not modify it."""
+        return self._sorted_names
     
     def get_card(self, filename):
-        """Get card pointer from cache."""
-        if filename in self.card_cache:
-            return self.card_cache[filename][0]
-        return None
+        """Get card pointer from cache, parsing the card on first use."""
+        if filename not in self.card_cache:
+            return None
+        card_ptr, last_modified = self.card_cache[filename]
+        if not card_ptr:
+            card_ptr, result = create_card(os.path.join(self.cards_dir, filename))
+            if result != VCardErrorCode.OK:
+                return None
+            self.card_cache[filename] = (card_ptr, last_modified)
+        return card_ptr
     
     def update_card(self, filename):
         """Force update of specific card in cache."""
@@ -1150,13 +1392,19 @@ class Model:
                         return True
                     delete_card(card_ptr)
             del self.card_cache[filename]
+            self._sorted_names = sorted(self.card_cache)
         return False
     
     def __del__(self):
         """Cleanup card cache on deletion."""
+        self._pool.shutdown(wait=True)
+        for _, _, future in self._pending.values():
+            self._discard_pending(future)
         for card_ptr, _ in self.card_cache.values():
             if card_ptr:
                 delete_card(card_ptr)
+        if self._mtime_db is not None:
+            self._mtime_db.close()
 
 def demo(screen, model):
     scenes = [
@@ -1171,14 +1419,17 @@ def demo(screen, model):
 
 def main():
     model = Model()
-    while True:
-        try:
-            Screen.wrapper(lambda screen: demo(screen, model))
-            break
-        except ResizeScreenError:
-            pass
-        except KeyboardInterrupt:
-            break
+    try:
+        while True:
+            try:
+                Screen.wrapper(lambda screen: demo(screen, model))
+                break
+            except ResizeScreenError:
+                pass
+            except KeyboardInterrupt:
+                break
+    finally:
+        model.close_db()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,185 @@
+# ctypes bindings for libvcparser, shared by A3main.py and create_test_cards.py.
+# The library is loaded and its signatures are set up once, on first import.
+
+import os
+import sys
+import ctypes
+from functools import lru_cache
+
+# Error codes from VCParser.h
+class VCardErrorCode:
+    OK = 0
+    INV_FILE = 1
+    INV_CARD = 2
+    INV_PROP = 3
+    INV_DT = 4
+    WRITE_ERROR = 5
+    OTHER_ERROR = 6
+
+# Python classes mirroring C structures
+class DateTime(ctypes.Structure):
+    _fields_ = [
+        ("UTC", ctypes.c_bool),
+        ("isText", ctypes.c_bool),
+        ("date", ctypes.c_char_p),
+        ("time", ctypes.c_char_p),
+        ("text", ctypes.c_char_p)
+    ]
+
+class Parameter(ctypes.Structure):
+    _fields_ = [
+        ("name", ctypes.c_char_p),
+        ("value", ctypes.c_char_p)
+    ]
+
+class Node(ctypes.Structure):
+    pass
+
+Node._fields_ = [
+    ("data", ctypes.c_void_p),
+    ("previous", ctypes.POINTER(Node)),
+    ("next", ctypes.POINTER(Node))
+]
+
+class List(ctypes.Structure):
+    _fields_ = [
+        ("head", ctypes.POINTER(Node)),
+        ("tail", ctypes.POINTER(Node)),
+        ("length", ctypes.c_int),
+        ("deleteData", ctypes.CFUNCTYPE(None, ctypes.c_void_p)),
+        ("compare", ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)),
+        ("printData", ctypes.CFUNCTYPE(ctypes.c_char_p, ctypes.c_void_p))
+    ]
+
+class Property(ctypes.Structure):
+    _fields_ = [
+        ("name", ctypes.c_char_p),
+        ("group", ctypes.c_char_p),
+        ("parameters", ctypes.POINTER(List)),
+        ("values", ctypes.POINTER(List))
+    ]
+
+class Card(ctypes.Structure):
+    _fields_ = [
+        ("fn", ctypes.POINTER(Property)),
+        ("optionalProperties", ctypes.POINTER(List)),
+        ("birthday", ctypes.POINTER(DateTime)),
+        ("anniversary", ctypes.POINTER(DateTime))
+    ]
+
+# Load the C library
+try:
+    lib_path = os.path.join(os.path.dirname(__file__), 'libvcparser.so')
+    libvc = ctypes.CDLL(lib_path)
+    
+    # Set up C function signatures
+    libvc.createCard.argtypes = [ctypes.c_char_p, ctypes.POINTER(ctypes.POINTER(Card))]
+    libvc.createCard.restype = ctypes.c_int  # VCardErrorCode
+    
+    libvc.validateCard.argtypes = [ctypes.POINTER(Card)]
+    libvc.validateCard.restype = ctypes.c_int  # VCardErrorCode
+    
+    libvc.writeCard.argtypes = [ctypes.c_char_p, ctypes.POINTER(Card)]
+    libvc.writeCard.restype = ctypes.c_int  # VCardErrorCode
+    
+    libvc.deleteCard.argtypes = [ctypes.POINTER(Card)]
+    libvc.deleteCard.restype = None
+    
+    libvc.cardToString.argtypes = [ctypes.POINTER(Card)]
+    libvc.cardToString.restype = ctypes.c_char_p
+    
+    libvc.scanValidCards.argtypes = [ctypes.c_char_p, ctypes.POINTER(ctypes.POINTER(ctypes.c_char_p)), ctypes.POINTER(ctypes.c_int)]
+    libvc.scanValidCards.restype = ctypes.c_int  # VCardErrorCode
+    
+    libvc.freeCardList.argtypes = [ctypes.POINTER(ctypes.c_char_p), ctypes.c_int]
+    libvc.freeCardList.restype = None
+    
+    libvc.setFN.argtypes = [ctypes.POINTER(Card), ctypes.c_char_p]
+    libvc.setFN.restype = ctypes.c_int  # VCardErrorCode
+    
+    libvc.getOptionalPropertyCount.argtypes = [ctypes.POINTER(Card)]
+    libvc.getOptionalPropertyCount.restype = ctypes.c_int
+    
+    libvc.getFNValue.argtypes = [ctypes.POINTER(Card)]
+    libvc.getFNValue.restype = ctypes.c_char_p
+
+except OSError as e:
+    print(f"Error loading C library: {e}")
+    sys.exit(1)
+
+# Bind the C entry points once so each call skips the CDLL attribute lookup
+_createCard = libvc.createCard
+_validateCard = libvc.validateCard
+_writeCard = libvc.writeCard
+_deleteCard = libvc.deleteCard
+_cardToString = libvc.cardToString
+_scanValidCards = libvc.scanValidCards
+_freeCardList = libvc.freeCardList
+_setFN = libvc.setFN
+_getOptionalPropertyCount = libvc.getOptionalPropertyCount
+_getFNValue = libvc.getFNValue
+
+_CardPtr = ctypes.POINTER(Card)
+
+@lru_cache(maxsize=256)
+def _fsencode(filename):
+    """Encode a path for the C library, reusing the bytes for repeated paths."""
+    return filename.encode('utf-8')
+
+# Wrapper functions for C library
+def create_card(filename, _byref=ctypes.byref, _OK=VCardErrorCode.OK):
+    """Create a Card object from a file."""
+    card_ptr = _CardPtr()
+    result = _createCard(_fsencode(filename), _byref(card_ptr))
+    if result != _OK:
+        return None, result
+    return card_ptr, result
+
+def validate_card(card):
+    """Validate a Card object."""
+    return _validateCard(card)
+
+def write_card(filename, card):
+    """Write a Card object to a file."""
+    return _writeCard(_fsencode(filename), card)
+
+def delete_card(card):
+    """Delete a Card object."""
+    _deleteCard(card)
+
+def card_to_string(card):
+    """Convert a Card object to string representation."""
+    result = _cardToString(card)
+    if result:
+        return result.decode('utf-8')
+    return None
+
+def set_fn(card, name):
+    """Replace the formatted name of a Card object in place."""
+    return _setFN(card, name.encode('utf-8'))
+
+def get_fn_value(card):
+    """Return the formatted name of a Card object, or None if it has none."""
+    result = _getFNValue(card)
+    if result is not None:
+        return result.decode('utf-8')
+    return None
+
+def get_optional_property_count(card):
+    """Return the number of optional properties in a Card object."""
+    return _getOptionalPropertyCount(card)
+
+def scan_valid_cards(dirname):
+    """Parse and validate every .vcf file in a directory with a single C call.
+    
+    Returns the result code and the list of valid file names.
+    """
+    names = ctypes.POINTER(ctypes.c_char_p)()
+    count = ctypes.c_int()
+    result = _scanValidCards(_fsencode(dirname), ctypes.byref(names), ctypes.byref(count))
+    if result != VCardErrorCode.OK:
+        return result, []
+    try:
+        return result, [names[i].decode('utf-8') for i in range(count.value)]
+    finally:
+        _freeCardList(names, count)
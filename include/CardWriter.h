@@ -20,4 +20,47 @@ VCardErrorCode writeCard(const char* fileName, const Card* obj);
  **/
 VCardErrorCode validateCard(const Card* obj);
 
+/** Function to collect the names of all valid vCard files in a directory
+ *@pre dirName is not NULL
+ *@post *out holds a newly allocated array of *count file names, to be released with freeCardList
+ *@return OK if the directory was scanned, INV_FILE if it could not be opened, OTHER_ERROR otherwise
+ *@param dirName - a string containing the path of the directory to scan
+ *@param out - receives the array of file names of valid cards
+ *@param count - receives the number of entries in *out
+ **/
+VCardErrorCode scanValidCards(const char* dirName, char*** out, int* count);
+
+/** Function to free a list of file names returned by scanValidCards
+ *@pre list was returned by scanValidCards, or is NULL
+ *@post list and every name in it have been freed
+ *@param list - the array of file names to free
+ *@param count - the number of entries in list
+ **/
+void freeCardList(char** list, int count);
+
+/** Function to replace the formatted name of a Card object
+ *@pre Card object exists, is not NULL, and has an FN property
+ *@post The first FN value has been replaced with a copy of value
+ *@return OK if successful, OTHER_ERROR if the card has no FN property or memory allocation fails
+ *@param obj - a pointer to the Card struct to modify
+ *@param value - a string containing the new formatted name
+ **/
+VCardErrorCode setFN(Card* obj, const char* value);
+
+/** Function to count the optional properties of a Card object
+ *@pre Card object exists, or is NULL
+ *@post Card has not been modified in any way
+ *@return The number of optional properties, or 0 if the card is NULL
+ *@param obj - a pointer to a Card struct
+ **/
+int getOptionalPropertyCount(const Card* obj);
+
+/** Function to get the formatted name of a Card object
+ *@pre Card object exists, or is NULL
+ *@post Card has not been modified in any way
+ *@return The first FN value, owned by the card, or NULL if there is none
+ *@param obj - a pointer to a Card struct
+ **/
+char* getFNValue(const Card* obj);
+
 #endif 
\ No newline at end of file
@@ -2,6 +2,21 @@
 #include <stdio.h>
 #include <string.h>
 #include <stdlib.h>
+#include <dirent.h>
+
+// Helper function to write a date-and-or-time property in vCard form, e.g. BDAY:19540203T123012Z
+static int writeDateTime(FILE* file, const char* propName, const DateTime* dt) {
+    if (dt == NULL) {
+        return 0;
+    }
+
+    if (dt->isText) {
+        return fprintf(file, "%s;VALUE=text:%s\r\n", propName, dt->text);
+    }
+
+    return fprintf(file, "%s:%s%s%s%s\r\n", propName, dt->date,
+                   strlen(dt->time) > 0 ? "T" : "", dt->time, dt->UTC ? "Z" : "");
+}
 
 VCardErrorCode writeCard(const char* fileName, const Card* obj) {
     // Input validation
@@ -63,63 +78,15 @@ VCardErrorCode writeCard(const char* fileName, const Card* obj) {
     }
 
     // Write BDAY if exists
-    if (obj->birthday != NULL) {
-        if (obj->birthday->isText) {
-            if (fprintf(file, "BDAY;VALUE=text:%s\r\n", obj->birthday->text) < 0) {
-                fclose(file);
-                return WRITE_ERROR;
-            }
-        } else {
-            // Handle time-only case
-            if (strlen(obj->birthday->date) == 0 && strlen(obj->birthday->time) > 0) {
-                if (fprintf(file, "BDAY:T%s\r\n", obj->birthday->time) < 0) {
-                    fclose(file);
-                    return WRITE_ERROR;
-                }
-            } else {
-                char* bdayStr = dateToString(obj->birthday);
-                if (bdayStr == NULL) {
-                    fclose(file);
-                    return WRITE_ERROR;
-                }
-                if (fprintf(file, "BDAY:%s\r\n", bdayStr) < 0) {
-                    free(bdayStr);
-                    fclose(file);
-                    return WRITE_ERROR;
-                }
-                free(bdayStr);
-            }
-        }
+    if (writeDateTime(file, "BDAY", obj->birthday) < 0) {
+        fclose(file);
+        return WRITE_ERROR;
     }
 
     // Write ANNIVERSARY if exists
-    if (obj->anniversary != NULL) {
-        if (obj->anniversary->isText) {
-            if (fprintf(file, "ANNIVERSARY;VALUE=text:%s\r\n", obj->anniversary->text) < 0) {
-                fclose(file);
-                return WRITE_ERROR;
-            }
-        } else {
-            // Handle time-only case
-            if (strlen(obj->anniversary->date) == 0 && strlen(obj->anniversary->time) > 0) {
-                if (fprintf(file, "ANNIVERSARY:T%s\r\n", obj->anniversary->time) < 0) {
-                    fclose(file);
-                    return WRITE_ERROR;
-                }
-            } else {
-                char* annivStr = dateToString(obj->anniversary);
-                if (annivStr == NULL) {
-                    fclose(file);
-                    return WRITE_ERROR;
-                }
-                if (fprintf(file, "ANNIVERSARY:%s\r\n", annivStr) < 0) {
-                    free(annivStr);
-                    fclose(file);
-                    return WRITE_ERROR;
-                }
-                free(annivStr);
-            }
-        }
+    if (writeDateTime(file, "ANNIVERSARY", obj->anniversary) < 0) {
+        fclose(file);
+        return WRITE_ERROR;
     }
 
     // Write END:VCARD
@@ -317,4 +284,129 @@ VCardErrorCode validateCard(const Card* obj) {
     }
 
     return OK;
-} 
\ No newline at end of file
+} 
+
+VCardErrorCode scanValidCards(const char* dirName, char*** out, int* count) {
+    // Input validation
+    if (dirName == NULL || out == NULL || count == NULL) {
+        return OTHER_ERROR;
+    }
+
+    *out = NULL;
+    *count = 0;
+
+    DIR* dir = opendir(dirName);
+    if (dir == NULL) {
+        return INV_FILE;
+    }
+
+    size_t dirLen = strlen(dirName);
+    int capacity = 0;
+    struct dirent* entry;
+    while ((entry = readdir(dir)) != NULL) {
+        // Only consider files with a .vcf extension
+        size_t nameLen = strlen(entry->d_name);
+        if (nameLen < 4 || strcmp(entry->d_name + nameLen - 4, ".vcf") != 0) {
+            continue;
+        }
+
+        char* path = malloc(dirLen + nameLen + 2);
+        if (path == NULL) {
+            break;
+        }
+        sprintf(path, "%s/%s", dirName, entry->d_name);
+
+        // Parse and validate, keeping only the file name of valid cards
+        Card* card = NULL;
+        bool valid = createCard(path, &card) == OK && validateCard(card) == OK;
+        if (card != NULL) {
+            deleteCard(card);
+        }
+        free(path);
+        if (!valid) {
+            continue;
+        }
+
+        // Grow the result array as needed
+        if (*count == capacity) {
+            int newCapacity = capacity == 0 ? 16 : capacity * 2;
+            char** grown = realloc(*out, newCapacity * sizeof(char*));
+            if (grown == NULL) {
+                break;
+            }
+            *out = grown;
+            capacity = newCapacity;
+        }
+
+        char* name = malloc(nameLen + 1);
+        if (name == NULL) {
+            break;
+        }
+        strcpy(name, entry->d_name);
+        (*out)[(*count)++] = name;
+    }
+
+    // readdir only returns NULL at the end of the directory, so anything else is an allocation failure
+    bool complete = entry == NULL;
+    closedir(dir);
+
+    if (!complete) {
+        freeCardList(*out, *count);
+        *out = NULL;
+        *count = 0;
+        return OTHER_ERROR;
+    }
+
+    return OK;
+}
+
+void freeCardList(char** list, int count) {
+    if (list == NULL) {
+        return;
+    }
+
+    for (int i = 0; i < count; i++) {
+        free(list[i]);
+    }
+    free(list);
+}
+
+VCardErrorCode setFN(Card* obj, const char* value) {
+    // Input validation
+    if (obj == NULL || value == NULL || obj->fn == NULL || obj->fn->values == NULL) {
+        return OTHER_ERROR;
+    }
+
+    char* copy = malloc(strlen(value) + 1);
+    if (copy == NULL) {
+        return OTHER_ERROR;
+    }
+    strcpy(copy, value);
+
+    // Replace the first FN value in place, leaving every other property untouched
+    Node* head = obj->fn->values->head;
+    if (head == NULL) {
+        insertBack(obj->fn->values, copy);
+    } else {
+        obj->fn->values->deleteData(head->data);
+        head->data = copy;
+    }
+
+    return OK;
+}
+
+int getOptionalPropertyCount(const Card* obj) {
+    if (obj == NULL || obj->optionalProperties == NULL) {
+        return 0;
+    }
+
+    return getLength(obj->optionalProperties);
+}
+
+char* getFNValue(const Card* obj) {
+    if (obj == NULL || obj->fn == NULL || obj->fn->values == NULL) {
+        return NULL;
+    }
+
+    return (char*)getFromFront(obj->fn->values);
+}
@@ -1,3 +1,6 @@
+// strtok_r is POSIX, not C11
+#define _POSIX_C_SOURCE 200809L
+
 #include "VCParser.h"
 #include <string.h>
 #include <stdio.h>
@@ -142,7 +145,9 @@ static char* parseParameters(const char* propNameStr, Property* prop) {
     char* nameCopy = dupString(propNameStr);
     if (nameCopy == NULL) return NULL;
 
-    char* baseName = strtok(nameCopy, ";");
+    //strtok_r keeps the tokenizer state local so cards can be parsed on several threads
+    char* savePtr = NULL;
+    char* baseName = strtok_r(nameCopy, ";", &savePtr);
     if (baseName == NULL) {
         free(nameCopy);
         return NULL;
@@ -156,7 +161,7 @@ static char* parseParameters(const char* propNameStr, Property* prop) {
     }
 
     //parse parameters
-    char* paramStr = strtok(NULL, ";");
+    char* paramStr = strtok_r(NULL, ";", &savePtr);
     while (paramStr != NULL) {
         // Split parameter at '='
         char* equals = strchr(paramStr, '=');
@@ -186,7 +191,7 @@ static char* parseParameters(const char* propNameStr, Property* prop) {
             return NULL;
         }
         insertBack(prop->parameters, param);
-        paramStr = strtok(NULL, ";");
+        paramStr = strtok_r(NULL, ";", &savePtr);
     }
 
     free(nameCopy);